@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import AuctionItem, Bid, Payment, LedgerBlock
+from .models import AuctionItem, Bid, Payment, LedgerBlock, ArchivedAuctionItem, ArchivedBid
 
 
 @admin.register(AuctionItem)
@@ -17,10 +17,30 @@ class BidAdmin(admin.ModelAdmin):
 
 @admin.register(Payment)
 class PaymentAdmin(admin.ModelAdmin):
-    list_display = ("id", "item", "buyer", "amount", "status", "provider", "created_at")
+    list_display = ("id", "item_id", "buyer", "amount", "status", "provider", "created_at")
     list_filter = ("status", "provider")
+    raw_id_fields = ("item",)
+
+    # The item may have moved to the archive, so show it rather than validate it.
+    def get_exclude(self, request, obj=None):
+        return ("item",) if obj else ()
+
+    def get_readonly_fields(self, request, obj=None):
+        return ("auction_item",) if obj else ()
 
 
 @admin.register(LedgerBlock)
 class LedgerBlockAdmin(admin.ModelAdmin):
     list_display = ("index", "hash", "previous_hash", "timestamp")
+
+
+@admin.register(ArchivedAuctionItem)
+class ArchivedAuctionItemAdmin(admin.ModelAdmin):
+    list_display = ("id", "title", "owner", "starting_price", "ends_at", "archived_at")
+    search_fields = ("title", "owner__username")
+
+
+@admin.register(ArchivedBid)
+class ArchivedBidAdmin(admin.ModelAdmin):
+    list_display = ("id", "item", "bidder", "amount", "created_at")
+    search_fields = ("item__title", "bidder__username")
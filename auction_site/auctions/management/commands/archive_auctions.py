@@ -0,0 +1,24 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+from auctions.utils import archive_ended_auctions
+
+
+class Command(BaseCommand):
+    help = 'Move settled auctions and their bids into the archive tables.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=30, help='Only archive auctions that ended at least this many days ago.')
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        if options['days'] < 0:
+            raise CommandError('--days must be 0 or greater.')
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be 1 or greater.')
+        count = archive_ended_auctions(
+            older_than=timedelta(days=options['days']),
+            batch_size=options['batch_size'],
+        )
+        self.stdout.write(self.style.SUCCESS(f'Archived {count} auction(s).'))
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:25
+
+import auctions.models
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auctions', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='payment',
+            name='item',
+            field=models.ForeignKey(db_constraint=False, on_delete=auctions.models.cascade_unless_archiving, related_name='payments', to='auctions.auctionitem'),
+        ),
+        migrations.CreateModel(
+            name='ArchivedAuctionItem',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=200)),
+                ('description', models.TextField(blank=True)),
+                ('image', models.ImageField(upload_to='items/')),
+                ('address', models.CharField(max_length=255)),
+                ('starting_price', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('buy_now_price', models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True)),
+                ('starts_at', models.DateTimeField()),
+                ('ends_at', models.DateTimeField()),
+                ('participants_count', models.PositiveIntegerField(default=0)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_items', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ArchivedBid',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('created_at', models.DateTimeField()),
+                ('bidder', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_bids', to=settings.AUTH_USER_MODEL)),
+                ('item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='bids', to='auctions.archivedauctionitem')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -1,9 +1,32 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 from django.db import models
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 
 User = get_user_model()
 
+_archiving = ContextVar('archiving', default=False)
+
+
+@contextmanager
+def archiving():
+    """Mark item deletes in this block as archive moves rather than removals."""
+    token = _archiving.set(True)
+    try:
+        yield
+    finally:
+        _archiving.reset(token)
+
+
+def cascade_unless_archiving(collector, field, sub_objs, using):
+    # Payments outlive items that are only moving to the archive tables.
+    if not _archiving.get():
+        models.CASCADE(collector, field, sub_objs, using)
+
 
 class AuctionItem(models.Model):
     owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name='owned_items')
@@ -17,6 +40,8 @@ class AuctionItem(models.Model):
     ends_at = models.DateTimeField()
     is_active = models.BooleanField(default=True)
 
+    is_archived = False
+
     def __str__(self) -> str:
         return f"{self.title} (#{self.pk})"
 
@@ -59,7 +84,13 @@ class AuctionParticipant(models.Model):
 
 
 class Payment(models.Model):
-    item = models.ForeignKey(AuctionItem, on_delete=models.CASCADE, related_name='payments')
+    # No DB constraint: the item row may move to ArchivedAuctionItem under the same pk.
+    item = models.ForeignKey(
+        AuctionItem,
+        on_delete=cascade_unless_archiving,
+        db_constraint=False,
+        related_name='payments',
+    )
     buyer = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='payments')
     amount = models.DecimalField(max_digits=12, decimal_places=2)
     provider = models.CharField(max_length=50, default='google_pay')
@@ -70,6 +101,12 @@ class Payment(models.Model):
     def __str__(self) -> str:
         return f"Payment {self.amount} for {self.item_id} ({self.status})"
 
+    @property
+    def auction_item(self):
+        """The paid-for item, read from the archive once the auction is settled."""
+        from .utils import get_item  # utils imports this module
+        return get_item(self.item_id)
+
 
 class LedgerBlock(models.Model):
     index = models.PositiveIntegerField()
@@ -85,4 +122,53 @@ class LedgerBlock(models.Model):
     def __str__(self) -> str:
         return f"Block {self.index} {self.hash[:8]}"
 
+
+class ArchivedAuctionItem(models.Model):
+    """Settled auction moved out of the live tables, keeping its original pk."""
+
+    id = models.BigIntegerField(primary_key=True)
+    owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name='archived_items')
+    title = models.CharField(max_length=200)
+    description = models.TextField(blank=True)
+    image = models.ImageField(upload_to='items/')
+    address = models.CharField(max_length=255)
+    starting_price = models.DecimalField(max_digits=12, decimal_places=2)
+    buy_now_price = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True)
+    starts_at = models.DateTimeField()
+    ends_at = models.DateTimeField()
+    participants_count = models.PositiveIntegerField(default=0)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    is_active = False
+    is_archived = True
+
+    def __str__(self) -> str:
+        return f"{self.title} (#{self.pk}, archived)"
+
+    @property
+    def highest_bid(self):
+        return self.bids.order_by('-amount', 'created_at').first()
+
+    def can_accept_bids(self) -> bool:
+        return False
+
+
+class ArchivedBid(models.Model):
+    item = models.ForeignKey(ArchivedAuctionItem, on_delete=models.CASCADE, related_name='bids')
+    bidder = models.ForeignKey(User, on_delete=models.CASCADE, related_name='archived_bids')
+    amount = models.DecimalField(max_digits=12, decimal_places=2)
+    created_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self) -> str:
+        return f"Archived bid {self.amount} on {self.item_id} by {self.bidder_id}"
+
+
+@receiver(pre_delete, sender=ArchivedAuctionItem)
+def delete_archived_item_payments(sender, instance, **kwargs):
+    # Payment.item only links to the live table, so the delete collector never reaches these.
+    Payment.objects.filter(item_id=instance.pk).delete()
+
 # Create your models here.
@@ -1,3 +1,199 @@
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
 from django.test import TestCase
+from django.utils import timezone
+
+from .models import (
+    ArchivedAuctionItem,
+    ArchivedBid,
+    AuctionItem,
+    AuctionParticipant,
+    Bid,
+    Payment,
+)
+from .utils import archive_ended_auctions
+
+User = get_user_model()
+
+
+class ArchiveTestMixin:
+    def setUp(self):
+        self.owner = User.objects.create_user('owner', password='pw')
+        self.bidder = User.objects.create_user('bidder', password='pw')
+
+    def make_item(self, ended_days_ago=60, **kwargs):
+        ends_at = timezone.now() - timedelta(days=ended_days_ago)
+        return AuctionItem.objects.create(
+            owner=self.owner,
+            title=kwargs.pop('title', 'Lamp'),
+            image='items/lamp.png',
+            address='1 Main St',
+            starting_price=Decimal('10.00'),
+            starts_at=ends_at - timedelta(days=7),
+            ends_at=ends_at,
+            **kwargs,
+        )
+
+
+class ArchiveEndedAuctionsTests(ArchiveTestMixin, TestCase):
+    def test_moves_ended_item_with_bids_and_participant_count(self):
+        item = self.make_item(description='Brass')
+        AuctionParticipant.objects.create(item=item, user=self.owner)
+        AuctionParticipant.objects.create(item=item, user=self.bidder)
+        Bid.objects.create(item=item, bidder=self.bidder, amount=Decimal('12.00'))
+        Bid.objects.create(item=item, bidder=self.owner, amount=Decimal('15.00'))
+
+        self.assertEqual(archive_ended_auctions(), 1)
+
+        archived = ArchivedAuctionItem.objects.get(pk=item.pk)
+        self.assertEqual(archived.title, 'Lamp')
+        self.assertEqual(archived.description, 'Brass')
+        self.assertEqual(archived.owner, self.owner)
+        self.assertEqual(archived.image.name, 'items/lamp.png')
+        self.assertEqual(archived.ends_at, item.ends_at)
+        self.assertEqual(archived.participants_count, 2)
+        self.assertEqual(
+            sorted(archived.bids.values_list('amount', flat=True)),
+            [Decimal('12.00'), Decimal('15.00')],
+        )
+        self.assertEqual(archived.highest_bid.amount, Decimal('15.00'))
+        self.assertFalse(AuctionItem.objects.filter(pk=item.pk).exists())
+        self.assertFalse(Bid.objects.exists())
+        self.assertFalse(AuctionParticipant.objects.exists())
+
+    def test_keeps_payment_linked_to_archived_item(self):
+        item = self.make_item()
+        payment = Payment.objects.create(
+            item=item, buyer=self.bidder, amount=Decimal('20.00'), status='succeeded',
+        )
+
+        archive_ended_auctions()
+
+        payment.refresh_from_db()
+        self.assertEqual(payment.item_id, item.pk)
+        self.assertEqual(payment.auction_item, ArchivedAuctionItem.objects.get(pk=item.pk))
+
+    def test_skips_live_and_recently_ended_items(self):
+        live = self.make_item(ended_days_ago=-1)
+        recent = self.make_item(ended_days_ago=5)
+
+        self.assertEqual(archive_ended_auctions(older_than=timedelta(days=30)), 0)
+
+        self.assertEqual(set(AuctionItem.objects.values_list('pk', flat=True)), {live.pk, recent.pk})
+        self.assertFalse(ArchivedAuctionItem.objects.exists())
+
+    def test_skips_items_with_in_flight_payments(self):
+        for status in ('pending', 'processing'):
+            with self.subTest(status=status):
+                item = self.make_item()
+                Payment.objects.create(item=item, buyer=self.bidder, amount=Decimal('20.00'), status=status)
+
+                self.assertEqual(archive_ended_auctions(), 0)
+                self.assertTrue(AuctionItem.objects.filter(pk=item.pk).exists())
+
+    def test_fresh_in_flight_payment_blocks_archiving_with_zero_days(self):
+        item = self.make_item()
+        Payment.objects.create(item=item, buyer=self.bidder, amount=Decimal('20.00'), status='processing')
+
+        self.assertEqual(archive_ended_auctions(older_than=timedelta(0)), 0)
+        call_command('archive_auctions', days=0, stdout=StringIO())
+
+        self.assertTrue(AuctionItem.objects.filter(pk=item.pk).exists())
+        self.assertFalse(ArchivedAuctionItem.objects.exists())
+
+    def test_archives_items_with_stale_in_flight_payments(self):
+        item = self.make_item()
+        payment = Payment.objects.create(
+            item=item, buyer=self.bidder, amount=Decimal('20.00'), status='processing',
+        )
+        Payment.objects.filter(pk=payment.pk).update(created_at=timezone.now() - timedelta(days=45))
+
+        self.assertEqual(archive_ended_auctions(), 1)
+        self.assertTrue(ArchivedAuctionItem.objects.filter(pk=item.pk).exists())
+
+    def test_archives_across_several_batches(self):
+        items = [self.make_item(title=f'Lot {n}') for n in range(5)]
+        for item in items:
+            for amount in ('11.00', '12.00', '13.00'):
+                Bid.objects.create(item=item, bidder=self.bidder, amount=Decimal(amount))
+
+        self.assertEqual(archive_ended_auctions(batch_size=2), 5)
+
+        self.assertFalse(AuctionItem.objects.exists())
+        self.assertEqual(
+            set(ArchivedAuctionItem.objects.values_list('pk', flat=True)),
+            {item.pk for item in items},
+        )
+        self.assertEqual(ArchivedBid.objects.count(), 15)
+
+    def test_second_run_is_a_no_op(self):
+        item = self.make_item()
+        Bid.objects.create(item=item, bidder=self.bidder, amount=Decimal('12.00'))
+
+        self.assertEqual(archive_ended_auctions(), 1)
+        self.assertEqual(archive_ended_auctions(), 0)
+
+        self.assertEqual(ArchivedAuctionItem.objects.count(), 1)
+        self.assertEqual(ArchivedBid.objects.count(), 1)
+
+    def test_deleting_live_item_still_deletes_its_payments(self):
+        item = self.make_item(ended_days_ago=-1)
+        Payment.objects.create(item=item, buyer=self.bidder, amount=Decimal('20.00'))
+
+        item.delete()
+
+        self.assertFalse(Payment.objects.exists())
+
+    def test_deleting_archived_item_deletes_its_payments(self):
+        item = self.make_item()
+        Payment.objects.create(item=item, buyer=self.bidder, amount=Decimal('20.00'), status='succeeded')
+        archive_ended_auctions()
+
+        ArchivedAuctionItem.objects.filter(pk=item.pk).delete()
+
+        self.assertFalse(Payment.objects.exists())
+
+    def test_deleting_owner_deletes_payments_of_archived_items(self):
+        item = self.make_item()
+        Payment.objects.create(item=item, buyer=self.bidder, amount=Decimal('20.00'), status='succeeded')
+        archive_ended_auctions()
+
+        self.owner.delete()
+
+        self.assertFalse(ArchivedAuctionItem.objects.exists())
+        self.assertFalse(Payment.objects.exists())
+
+
+class ArchiveAuctionsCommandTests(TestCase):
+    def test_rejects_invalid_options(self):
+        for options in ({'days': -1}, {'batch_size': 0}, {'batch_size': -5}):
+            with self.subTest(**options):
+                with self.assertRaises(CommandError):
+                    call_command('archive_auctions', **options)
+
+
+class ItemDetailTests(ArchiveTestMixin, TestCase):
+    def test_renders_archived_item(self):
+        item = self.make_item(buy_now_price=Decimal('50.00'))
+        Bid.objects.create(item=item, bidder=self.bidder, amount=Decimal('12.00'))
+        archive_ended_auctions()
+        self.client.force_login(self.bidder)
+
+        response = self.client.get(f'/items/{item.pk}/', secure=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['item'], ArchivedAuctionItem.objects.get(pk=item.pk))
+        self.assertContains(response, 'This auction has ended and been archived.')
+        self.assertContains(response, 'Highest bid: <strong>12.00</strong>', html=True)
+        self.assertNotContains(response, f'/items/{item.pk}/bid/')
+        self.assertNotContains(response, f'/items/{item.pk}/buy/')
+
+    def test_unknown_item_is_404(self):
+        response = self.client.get('/items/999/', secure=True)
 
-# Create your tests here.
+        self.assertEqual(response.status_code, 404)
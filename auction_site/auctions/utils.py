@@ -1,7 +1,11 @@
 import hashlib
-from typing import Dict, Any
+from datetime import timedelta
+from typing import Dict, Any, Optional, Union
 from django.db import transaction
-from .models import LedgerBlock
+from django.db.models import Count
+from django.http import Http404
+from django.utils import timezone
+from .models import AuctionItem, AuctionParticipant, ArchivedAuctionItem, ArchivedBid, Bid, LedgerBlock, Payment, archiving
 
 
 def compute_hash(data: str) -> str:
@@ -22,3 +26,99 @@ def append_ledger_block(data: Dict[str, Any]) -> LedgerBlock:
             hash=block_hash,
         )
         return block
+
+
+def get_item(pk: int) -> Optional[Union[AuctionItem, ArchivedAuctionItem]]:
+    """Look up a live item, falling back to the archive for settled auctions."""
+    item = AuctionItem.objects.filter(pk=pk).first()
+    if item is None:
+        item = ArchivedAuctionItem.objects.filter(pk=pk).first()
+    return item
+
+
+def get_item_or_404(pk: int) -> Union[AuctionItem, ArchivedAuctionItem]:
+    item = get_item(pk)
+    if item is None:
+        raise Http404('No auction item matches the given query.')
+    return item
+
+
+def archive_ended_auctions(
+    older_than: timedelta = timedelta(days=30),
+    batch_size: int = 500,
+    stale_payment_after: timedelta = timedelta(days=7),
+) -> int:
+    """Move settled auctions and their bids out of the live tables.
+
+    An auction is settled once it ended before ``now - older_than`` and has no
+    pending or processing payment younger than ``stale_payment_after``. Older
+    in-flight payments are treated as abandoned checkouts. Archived rows keep
+    the original item pk, so ``Payment.item_id`` and ledger block data keep
+    pointing at the same item. Returns the number of items archived.
+    """
+    now = timezone.now()
+    cutoff = now - older_than
+    unsettled = Payment.objects.filter(
+        status__in=('pending', 'processing'),
+        created_at__gte=now - stale_payment_after,
+    ).values('item_id')
+    candidates = (
+        AuctionItem.objects.filter(ends_at__lt=cutoff)
+        .exclude(pk__in=unsettled)
+        .order_by('pk')
+    )
+    archived = 0
+    while True:
+        with transaction.atomic():
+            # Row locks keep buy_now from attaching a payment mid-archive.
+            items = list(candidates.select_for_update()[:batch_size])
+            if not items:
+                break
+            item_ids = [item.pk for item in items]
+            participant_counts = dict(
+                AuctionParticipant.objects.filter(item_id__in=item_ids)
+                .values('item_id')
+                .annotate(num=Count('id'))
+                .values_list('item_id', 'num')
+            )
+            ArchivedAuctionItem.objects.bulk_create([
+                ArchivedAuctionItem(
+                    id=item.pk,
+                    owner_id=item.owner_id,
+                    title=item.title,
+                    description=item.description,
+                    image=item.image.name,
+                    address=item.address,
+                    starting_price=item.starting_price,
+                    buy_now_price=item.buy_now_price,
+                    starts_at=item.starts_at,
+                    ends_at=item.ends_at,
+                    participants_count=participant_counts.get(item.pk, 0),
+                )
+                for item in items
+            ])
+            # Stream bids so memory stays bounded by batch_size, not bids per item.
+            bids = (
+                Bid.objects.filter(item_id__in=item_ids)
+                .order_by()
+                .values('item_id', 'bidder_id', 'amount', 'created_at')
+                .iterator(chunk_size=batch_size)
+            )
+            chunk = []
+            for bid in bids:
+                chunk.append(ArchivedBid(
+                    item_id=bid['item_id'],
+                    bidder_id=bid['bidder_id'],
+                    amount=bid['amount'],
+                    created_at=bid['created_at'],
+                ))
+                if len(chunk) >= batch_size:
+                    ArchivedBid.objects.bulk_create(chunk)
+                    chunk = []
+            if chunk:
+                ArchivedBid.objects.bulk_create(chunk)
+            # Cascades to Bid and AuctionParticipant; Payment rows are left in place.
+            with archiving():
+                AuctionItem.objects.filter(pk__in=item_ids).delete()
+        archived += len(items)
+    return archived
@@ -4,12 +4,13 @@ from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.forms import UserCreationForm, AuthenticationForm
 from django.shortcuts import render, redirect, get_object_or_404
+from django.db import transaction
 from django.utils import timezone
 from django.http import HttpRequest, HttpResponse
 from django import forms
 
 from .models import AuctionItem, Bid, Payment, AuctionParticipant
-from .utils import append_ledger_block
+from .utils import append_ledger_block, get_item_or_404
 
 
 class AuctionItemForm(forms.ModelForm):
@@ -80,7 +81,7 @@ def item_create(request: HttpRequest) -> HttpResponse:
 
 
 def item_detail(request: HttpRequest, pk: int) -> HttpResponse:
-    item = get_object_or_404(AuctionItem, pk=pk)
+    item = get_item_or_404(pk)
     bids = item.bids.select_related('bidder').all()
     return render(request, 'auctions/item_detail.html', {
         'item': item,
@@ -123,11 +124,13 @@ def place_bid(request: HttpRequest, pk: int) -> HttpResponse:
 
 @login_required
 def buy_now(request: HttpRequest, pk: int) -> HttpResponse:
-    item = get_object_or_404(AuctionItem, pk=pk)
-    if item.buy_now_price is None:
-        messages.error(request, 'Buy now is not available for this item.')
-        return redirect('item_detail', pk=pk)
-    payment = Payment.objects.create(item=item, buyer=request.user, amount=item.buy_now_price)
+    with transaction.atomic():
+        # Same row lock as archive_ended_auctions, so the item cannot be archived under us.
+        item = get_object_or_404(AuctionItem.objects.select_for_update(), pk=pk)
+        if item.buy_now_price is None:
+            messages.error(request, 'Buy now is not available for this item.')
+            return redirect('item_detail', pk=pk)
+        payment = Payment.objects.create(item=item, buyer=request.user, amount=item.buy_now_price)
     return redirect('google_pay_start', pk=payment.pk)
 
 
@@ -157,6 +160,6 @@ def google_pay_callback(request: HttpRequest, pk: int) -> HttpResponse:
         'timestamp': timezone.now().isoformat(),
     })
     messages.success(request, 'Payment successful!')
-    return redirect('item_detail', pk=payment.item.pk)
+    return redirect('item_detail', pk=payment.item_id)
 
 # Create your views here.